@@ -6,186 +6,913 @@ objects from Amazon S3.
 
 Functions:
  - list_objects_s3
+ - iter_objects_s3
  - upload_object_s3
  - download_object_s3
  - delete_object_s3
+ - delete_objects_s3
+ - upload_many_s3
+ - download_many_s3
+ - delete_many_s3
+
+Large uploads and downloads go through the AWS Common Runtime (CRT) transfer client
+when awscrt >= 0.19.18 is installed (`pip install "boto3[crt]"`) and the endpoint uses
+HTTPS, which runs multipart transfers in C; otherwise boto3's Python transfer manager is used.
+Requires botocore >= 1.36 for the `request_checksum_calculation` client setting.
 
 References:
  - Boto3 Official Documentation: https://boto3.amazonaws.com/v1/documentation/api/latest/guide/quickstart.html
  - Amazon S3 examples: https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-examples.html
 """
 
+import functools
+import hashlib
+import http.client
+import logging
 import os
-import warnings
+import threading
+import urllib.parse
+import uuid
+from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Iterable, List, Optional, Tuple
 import boto3
+import botocore.config
+from botocore.compat import HAS_CRT
+from botocore.exceptions import ClientError
 from boto3.s3.transfer import TransferConfig
 
-# Ignore warnings (useful for suppressing unnecessary warnings from Boto3)
-warnings.filterwarnings("ignore")
+log = logging.getLogger(__name__)
+
+# C-implemented key lookup for the list_objects_v2 'Contents' entries
+_KEY = itemgetter("Key")
 
 
-def list_objects_s3(bucket_name: str, prefix: str = "", max_keys: int = 123):
+def _crt_version_at_least(minimum: Tuple[int, ...]):
     """
-    List objects in an S3 bucket with a given prefix.
+    Check whether the installed awscrt is at least the given version.
 
-    The boto3 list_objects_v2 method paginates results if there are many objects.
-    This function handles pagination to get all object keys.
+    Parameters:
+    - minimum (tuple of int): The minimum version, e.g. (0, 19, 18).
+
+    Returns:
+    - True if awscrt is installed with a parseable version >= `minimum`, False otherwise.
+    """
+    if not HAS_CRT:
+        return False
+
+    import awscrt
+
+    try:
+        return tuple(int(part) for part in awscrt.__version__.split(".")) >= minimum
+    except ValueError:
+        return False
+
+
+# boto3 refuses preferred_transfer_client="crt" (instead of falling back) unless
+# awscrt >= 0.19.18 is installed, so only ask for the CRT client when it is available
+_HAS_MIN_CRT = _crt_version_at_least((0, 19, 18))
+
+# Checksum sent with uploads: botocore computes CRC32C through awscrt, so fall back to the
+# zlib-backed CRC32 when the CRT is not installed
+_CHECKSUM_ALGORITHM = "CRC32C" if HAS_CRT else "CRC32"
+
+# Shared S3 client, created on first use so its connection pool is reused across calls
+_S3 = None
+
+# Guards the lazy creation of the shared objects, which pool workers may race to create
+_INIT_LOCK = threading.Lock()
+
+# Shared thread pool for the batch helpers, created on first use
+_EXECUTOR = None
+
+
+def _get_client():
+    """
+    Return the module-level S3 client, creating it on first use.
+
+    boto3 clients are thread-safe, so a single client (and its HTTP connection pool)
+    is shared by every function in this module instead of building a new one per call.
+    Creation is serialized by a lock: the batch helpers can make their first call from
+    many pool workers at once, and boto3's default session is not thread-safe.
+
+    Returns:
+    - The shared boto3 S3 client.
+    """
+    global _S3
+    if _S3 is None:
+        with _INIT_LOCK:
+            # Another thread may have created the client while this one waited
+            if _S3 is None:
+                _S3 = boto3.client(
+                    "s3",
+                    config=botocore.config.Config(
+                        # Size the pool for concurrent use of the shared client
+                        max_pool_connections=50,
+                        # Keep idle pooled sockets alive so they are not dropped between
+                        # bursts of calls
+                        tcp_keepalive=True,
+                        connect_timeout=3,
+                        read_timeout=60,
+                        # Only compute checksums that are explicitly requested
+                        # (ChecksumAlgorithm) or required by the operation, so upload
+                        # bodies are not checksummed twice. Response validation keeps
+                        # its default, so downloads still verify stored checksums.
+                        request_checksum_calculation="when_required",
+                        # Adaptive retries back off and pace requests client-side when
+                        # S3 throttles (SlowDown)
+                        retries={"max_attempts": 10, "mode": "adaptive"},
+                    ),
+                )
+    return _S3
+
+
+def _get_executor():
+    """
+    Return the module-level thread pool, creating it on first use.
+
+    The batch helpers share this pool instead of starting and stopping threads on every call.
+    Each task makes one request at a time per transfer thread, so the requests in flight are
+    the 32 workers times the helper's per-transfer `max_concurrency`. upload_many_s3 and
+    download_many_s3 default that to 1, which keeps the total (32) below the shared client's
+    max_pool_connections (50). Beyond that urllib3 discards connections instead of reusing
+    them, so an injected executor or a higher `max_concurrency` should keep
+    workers x max_concurrency <= 50. Creation takes the same lock as _get_client() so
+    concurrent first calls share one pool rather than leaking extra ones.
+
+    Returns:
+    - The shared ThreadPoolExecutor.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _INIT_LOCK:
+            # Another thread may have created the pool while this one waited
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=32)
+    return _EXECUTOR
+
+
+def _put_sendfile(bucket_name: str, object_name: str, file_path: str):
+    """
+    Upload a file with a single PUT to a presigned URL, sending the body with socket.sendfile.
+
+    Only used for plain-HTTP endpoints (e.g. MinIO on the local network): without TLS the
+    kernel can copy the file straight to the socket, skipping the userspace read buffers.
+    The request bypasses botocore, so it opens its own connection, is not retried, and
+    sends no ChecksumAlgorithm checksum; it is therefore only used when asked for.
 
     Parameters:
     - bucket_name (str): The name of the S3 bucket.
-    - prefix (str, optional): A prefix to filter objects by. Default is an empty string, meaning no filtering.
-    - max_keys (int, optional): The maximum number of object keys to retrieve per request. Default is 123.
+    - object_name (str): The name of the object in the S3 bucket.
+    - file_path (str): The local path to the file to be uploaded.
 
     Returns:
-    - List of object keys (str) in the specified S3 bucket with the given prefix.
+    - Dict with the ETag of the uploaded object.
+
+    Raises:
+    - botocore.exceptions.ClientError: If the endpoint rejects the upload, with the S3 error code.
+    """
+    url = _get_client().generate_presigned_url(
+        "put_object", Params={"Bucket": bucket_name, "Key": object_name}
+    )
+    parts = urllib.parse.urlsplit(url)
+
+    # Bound the connection and each socket operation by the shared client's read timeout
+    conn = http.client.HTTPConnection(
+        parts.netloc, timeout=_get_client().meta.config.read_timeout
+    )
+    try:
+        with open(file_path, "rb") as f:
+            conn.putrequest(
+                "PUT", f"{parts.path}?{parts.query}", skip_accept_encoding=True
+            )
+            conn.putheader("Content-Length", str(os.fstat(f.fileno()).st_size))
+            conn.endheaders()
+            # Zero-copy file-to-socket transfer (falls back to send() where unsupported)
+            conn.sock.sendfile(f)
+        response = conn.getresponse()
+        body = response.read()
+    finally:
+        conn.close()
+
+    if response.status != 200:
+        # Report the S3 error code (e.g. NoSuchBucket) like botocore does, not the HTTP status
+        error = {"Code": str(response.status), "Message": response.reason}
+        try:
+            root = ElementTree.fromstring(body)
+            error["Code"] = root.findtext("Code", error["Code"])
+            error["Message"] = root.findtext("Message", error["Message"])
+        except ElementTree.ParseError:
+            pass
+        raise ClientError(
+            {"Error": error, "ResponseMetadata": {"HTTPStatusCode": response.status}},
+            "PutObject",
+        )
+    return {"ETag": response.getheader("ETag")}
+
+
+def _part_size(file_size: int, min_part_size: int = 16 * 1024 * 1024):
+    """
+    Pick a multipart part size for a file of the given size.
+
+    The part size is the smallest power of two that keeps the upload under 10,000 parts
+    (9,500 leaves some headroom), clamped to [min_part_size, 5GB], the S3 maximum part size.
+
+    Parameters:
+    - file_size (int): The size of the file in bytes.
+    - min_part_size (int, optional): The smallest part size to use in bytes. Default is 16MB.
+
+    Returns:
+    - The part size in bytes.
+    """
+    part_size = max(min_part_size, 1 << (file_size // 9500).bit_length())
+    return min(part_size, 5 * 1024 * 1024 * 1024)
+
+
+@functools.lru_cache(maxsize=32)
+def _transfer_config(
+    multipart_threshold: int,
+    multipart_chunksize: int,
+    max_concurrency: int,
+    use_crt: bool = False,
+):
+    """
+    Return a TransferConfig for the given settings, cached so repeated transfers share it.
+
+    With `use_crt` the config selects the CRT transfer client; otherwise it configures
+    boto3's Python transfer manager.
+
+    Parameters:
+    - multipart_threshold (int): File size in bytes above which multipart transfers are used.
+    - multipart_chunksize (int): Size in bytes of each multipart part or byte range.
+    - max_concurrency (int): The number of parts transferred in parallel.
+    - use_crt (bool, optional): Use the CRT transfer client (see `_use_crt`). Default is False.
+
+    Returns:
+    - The TransferConfig.
     """
-    # Create an S3 client to interact with AWS S3
-    s3_client = boto3.client("s3")
+    if use_crt:
+        # The CRT transfer client rejects the thread and I/O settings of the Python
+        # transfer manager, so only pass the options it supports
+        return TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            preferred_transfer_client="crt",
+        )
+
+    return TransferConfig(
+        # File size threshold for multipart transfers (larger files are transferred in parts)
+        multipart_threshold=multipart_threshold,
+        # Chunk size per part for multipart transfers
+        multipart_chunksize=multipart_chunksize,
+        # Number of parts transferred in parallel
+        max_concurrency=max_concurrency,
+        use_threads=True,
+        # Size of each read from the file or download stream (1MB)
+        io_chunksize=1 * 1024 * 1024,
+    )
+
 
-    # Initialize the continuation token and list to hold object keys
-    continuation_token = None
-    object_keys = []
+def _use_crt():
+    """
+    Check whether transfers can use the CRT transfer client.
+
+    boto3 builds its CRT client with TLS only, so plain-HTTP endpoints (e.g. a local MinIO)
+    stay on the Python transfer manager.
+
+    Returns:
+    - True if awscrt is available and the shared client's endpoint uses HTTPS.
+    """
+    return _HAS_MIN_CRT and _get_client().meta.endpoint_url.startswith("https://")
+
+
+def _file_md5(file_path: str):
+    """
+    Compute the MD5 hex digest of a local file, reading it in 8MB chunks.
+
+    Parameters:
+    - file_path (str): The local path to the file.
+
+    Returns:
+    - The MD5 hex digest (str) of the file contents.
+    """
+    md5 = hashlib.md5()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(8 * 1024 * 1024), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
 
+
+def _head_object(bucket_name: str, object_name: str):
+    """
+    Fetch the metadata of an S3 object with head_object.
+
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - object_name (str): The name of the object in the S3 bucket.
+
+    Returns:
+    - The head_object response (dict), or None if the object does not exist.
+    """
     try:
-        while True:
-            # Paginate results if necessary using ContinuationToken
-            if continuation_token:
-                response = s3_client.list_objects_v2(
-                    Bucket=bucket_name,
-                    Prefix=prefix,
-                    MaxKeys=max_keys,
-                    ContinuationToken=continuation_token,
-                )
-            else:
-                response = s3_client.list_objects_v2(
-                    Bucket=bucket_name,
-                    Prefix=prefix,
-                    MaxKeys=max_keys,
-                )
+        return _get_client().head_object(Bucket=bucket_name, Key=object_name)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+
+
+def _matches_local(head: dict, file_path: str):
+    """
+    Check whether a local file has the same contents as an S3 object.
+
+    Single-part objects have the MD5 of their contents as ETag, so the MD5 of the file is compared.
+    Multipart ETags (containing "-") are not a plain MD5, so the size and the "mtime" metadata
+    stored by upload_object_s3 are compared; objects without that metadata never match.
+
+    Parameters:
+    - head (dict): The head_object response for the S3 object.
+    - file_path (str): The local path to the file.
+
+    Returns:
+    - True if the local file matches the S3 object, False otherwise.
+    """
+    if not os.path.isfile(file_path):
+        return False
+    if head["ContentLength"] != os.path.getsize(file_path):
+        return False
+
+    etag = head["ETag"].strip('"')
+    if "-" not in etag:
+        return etag == _file_md5(file_path)
+
+    # Without the stored mtime (objects not uploaded by this module) a same-size file proves
+    # nothing, so treat it as changed and transfer again
+    mtime = head.get("Metadata", {}).get("mtime")
+    return mtime is not None and mtime == str(int(os.path.getmtime(file_path)))
+
+
+def iter_objects_s3(bucket_name: str, prefix: str = "", max_keys: int = 1000):
+    """
+    Iterate over the objects in an S3 bucket with a given prefix.
 
-            # Check if the response contains 'Contents' (object keys)
-            if "Contents" in response:
-                # Add object keys to the list
-                object_keys.extend(d["Key"] for d in response["Contents"])
+    Keys are yielded page by page as the list_objects_v2 paginator fetches them, so callers
+    can start working on the first keys after one request and memory stays bounded by a page.
 
-            # Get the continuation token for pagination if more objects exist
-            continuation_token = response.get("NextContinuationToken")
-            if not continuation_token:
-                # Exit the loop if no more objects are left
-                break
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - prefix (str, optional): A prefix to filter objects by. Default is an empty string, meaning no filtering.
+    - max_keys (int, optional): The maximum number of object keys to retrieve per request. Default is 1000 (the S3 maximum).
+
+    Yields:
+    - Object keys (str) in the specified S3 bucket with the given prefix.
+
+    Raises:
+    - botocore.exceptions.ClientError: If a list request fails after the client's retries.
+    """
+    paginator = _get_client().get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": max_keys},
+    )
 
-    except Exception as e:
-        print(f"Error listing objects: {e}")
+    try:
+        for page in pages:
+            # Pages without 'Contents' (no matching objects) yield nothing
+            yield from map(_KEY, page.get("Contents", ()))
+    except ClientError as e:
+        log.error("S3 list_objects_v2 failed: %s", e.response["Error"]["Code"])
+        raise
+
+
+def list_objects_s3(
+    bucket_name: str,
+    prefix: str = "",
+    max_keys: int = 1000,
+    partitions: Optional[Iterable[str]] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+):
+    """
+    List objects in an S3 bucket with a given prefix.
 
-    return object_keys
+    The boto3 list_objects_v2 method paginates results if there are many objects.
+    This function collects all object keys from iter_objects_s3. When `partitions`
+    is given, the listing is split into one sub-prefix per partition (prefix + partition)
+    and the sub-prefixes are listed concurrently in a thread pool.
 
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - prefix (str, optional): A prefix to filter objects by. Default is an empty string, meaning no filtering.
+    - max_keys (int, optional): The maximum number of object keys to retrieve per request. Default is 1000 (the S3 maximum).
+    - partitions (iterable of str, optional): Suffixes appended to `prefix` to build the sub-prefixes
+      listed in parallel, e.g. "0123456789abcdef" for hex-named keys. Only keys starting with one of
+      the sub-prefixes are returned, so the partitions must cover the key space. Default is None,
+      meaning a single serial listing.
+    - executor (ThreadPoolExecutor, optional): The thread pool to run on. Default is None, meaning the
+      module's shared 32-thread pool (see `_get_executor`).
 
-def upload_object_s3(bucket_name: str, file_path: str, object_name: str):
+    Returns:
+    - List of object keys (str) in the specified S3 bucket with the given prefix.
+
+    Raises:
+    - botocore.exceptions.ClientError: If a list request fails after the client's retries.
+    """
+    if partitions is None:
+        return list(iter_objects_s3(bucket_name, prefix, max_keys))
+
+    subprefixes = [prefix + partition for partition in partitions]
+
+    results = (executor or _get_executor()).map(
+        lambda subprefix: list(iter_objects_s3(bucket_name, subprefix, max_keys)),
+        subprefixes,
+    )
+    # Flatten the per-partition key lists, keeping partition order
+    return [key for keys in results for key in keys]
+
+
+def upload_object_s3(
+    bucket_name: str,
+    file_path: str,
+    object_name: str,
+    multipart_threshold: int = 64 * 1024 * 1024,
+    multipart_chunksize: int = 16 * 1024 * 1024,
+    max_concurrency: int = 16,
+    upload_cutoff: int = 16 * 1024 * 1024,
+    skip_unchanged: bool = False,
+    zero_copy: bool = False,
+):
     """
     Upload an object (file) to an S3 bucket.
 
-    This function uploads a file to an S3 bucket. It uses multipart uploads for large files (over 8MB)
-    to ensure the upload is efficient and can handle larger files without running into memory issues.
+    This function uploads a file to an S3 bucket. Small files (under 16MB by default) are sent
+    with a single put_object request, skipping the transfer manager entirely. It uses concurrent
+    multipart uploads for large files (over 64MB by default) to ensure the upload is efficient and
+    can handle larger files without running into memory issues. The part size grows with the file
+    size (see `_part_size`) so that a file never needs more than 10,000 parts (the S3 limit).
+    With `zero_copy`, files below `multipart_threshold` sent to a plain-HTTP endpoint (e.g. a
+    local MinIO set through AWS_ENDPOINT_URL) use a single sendfile PUT (see `_put_sendfile`).
+    With `skip_unchanged`, a head_object request is made first and the upload is skipped when
+    the object already matches the local file.
 
     Parameters:
     - bucket_name (str): The name of the S3 bucket.
     - file_path (str): The local path to the file to be uploaded.
     - object_name (str): The name of the object in the S3 bucket (including any prefix or folder structure).
+    - multipart_threshold (int, optional): File size in bytes above which multipart upload is used. Default is 64MB.
+    - multipart_chunksize (int, optional): Minimum size in bytes of each multipart part. Default is 16MB.
+    - max_concurrency (int, optional): The number of threads uploading parts concurrently. Default is 16.
+    - upload_cutoff (int, optional): File size in bytes below which a single put_object is used. Default is 16MB.
+    - skip_unchanged (bool, optional): Skip the upload if the S3 object already matches the file. Default is False.
+    - zero_copy (bool, optional): Use the sendfile PUT on plain-HTTP endpoints. It is not retried and
+      sends no checksum. Default is False.
 
     Returns:
-    - None: Prints a success message or an error message based on the result of the upload.
-    """
-    # Create an S3 client to interact with AWS S3
-    s3_client = boto3.client("s3")
+    - None: Logs a success message once the upload is complete.
 
-    # Set up transfer configuration to use multipart uploads for large files
-    config = TransferConfig(
-        # File size threshold (8MB) for multipart upload (files larger than this will be uploaded in parts)
-        multipart_threshold=8 * 1024 * 1024,
-        # Chunk size per part for multipart upload (8MB)
-        multipart_chunksize=8 * 1024 * 1024,
-    )
+    Raises:
+    - botocore.exceptions.ClientError: If the upload fails after the client's retries.
+    - OSError: If the local file cannot be read.
+    """
+    # Reuse the shared S3 client to interact with AWS S3
+    s3_client = _get_client()
 
     try:
-        # Inform the user about the file being uploaded
-        print(f"Uploading {file_path} to S3 bucket {bucket_name} as {object_name}...")
+        if skip_unchanged:
+            head = _head_object(bucket_name, object_name)
+            if head is not None and _matches_local(head, file_path):
+                log.info(
+                    "Skipping upload of %s: %s/%s is unchanged",
+                    file_path,
+                    bucket_name,
+                    object_name,
+                )
+                return
+
+        file_size = os.path.getsize(file_path)
 
-        # Perform the upload using the boto3 upload_file method with the configured transfer settings
-        response = s3_client.upload_file(
-            file_path, bucket_name, object_name, Config=config
+        # Inform the user about the file being uploaded
+        log.info(
+            "Uploading %s to S3 bucket %s as %s...", file_path, bucket_name, object_name
         )
 
-        # Print a success message upon successful upload
-        print(f"File {file_path} uploaded successfully to {bucket_name}/{object_name}")
-        print(f"Response: {response}")
+        if (
+            zero_copy
+            and file_size < multipart_threshold
+            and s3_client.meta.endpoint_url.startswith("http://")
+        ):
+            # Plain-HTTP (local S3-compatible) endpoint: let the kernel send the file
+            response = _put_sendfile(bucket_name, object_name, file_path)
+        elif file_size < upload_cutoff:
+            # Send small files in one PUT request instead of a multipart upload
+            with open(file_path, "rb") as f:
+                response = s3_client.put_object(
+                    Bucket=bucket_name,
+                    Key=object_name,
+                    Body=f.read(),
+                    ChecksumAlgorithm=_CHECKSUM_ALGORITHM,
+                )
+        else:
+            # Scale the part size with the file so it stays under the 10,000-part S3 limit
+            part_size = _part_size(file_size, multipart_chunksize)
+
+            # Reuse the cached transfer configuration for concurrent multipart uploads
+            config = _transfer_config(
+                multipart_threshold, part_size, max_concurrency, _use_crt()
+            )
+
+            mtime = str(int(os.path.getmtime(file_path)))
+
+            # Perform the upload using the boto3 upload_file method with the configured transfer settings
+            response = s3_client.upload_file(
+                file_path,
+                bucket_name,
+                object_name,
+                # Multipart ETags are not an MD5, so store the mtime for skip_unchanged checks
+                ExtraArgs={
+                    "Metadata": {"mtime": mtime},
+                    # Hardware-accelerated CRC integrity checks per part instead of MD5
+                    "ChecksumAlgorithm": _CHECKSUM_ALGORITHM,
+                },
+                Config=config,
+            )
+    except ClientError as e:
+        log.error("S3 upload failed: %s", e.response["Error"]["Code"])
+        raise
+
+    # Log a success message upon successful upload
+    log.info(
+        "File %s uploaded successfully to %s/%s", file_path, bucket_name, object_name
+    )
+    log.debug("Response: %s", response)
+
+
+def _download_ranged(
+    bucket_name: str,
+    object_name: str,
+    download_path: str,
+    head: dict,
+    part_size: int,
+    max_concurrency: int,
+):
+    """
+    Download an object with concurrent byte-range GET requests.
 
-    except Exception as e:
-        print(f"Error uploading file: {e}")
+    The object size and ETag are taken from the caller's head_object response, the object is
+    split into ranges of `part_size` bytes, and each range is fetched (pinned to that ETag) in a
+    thread pool and written at its offset in a temporary file, which replaces `download_path`
+    on success.
 
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - object_name (str): The name of the object in the S3 bucket to be downloaded.
+    - download_path (str): The local path where the file will be saved.
+    - head (dict): The head_object response for the object.
+    - part_size (int): The size in bytes of each byte range.
+    - max_concurrency (int): The number of ranges downloaded concurrently.
+
+    Returns:
+    - None
+    """
+    s3_client = _get_client()
+    size = head["ContentLength"]
+
+    # Write into a temporary file next to the destination and only move it into place once
+    # every range has arrived, so a failed download never leaves a partly filled file behind
+    temp_path = f"{download_path}.{uuid.uuid4().hex[:8]}"
+
+    def download_range(start):
+        end = min(start + part_size, size) - 1
+        response = s3_client.get_object(
+            Bucket=bucket_name,
+            Key=object_name,
+            Range=f"bytes={start}-{end}",
+            # Fail (412) instead of mixing versions if the object is overwritten mid-download
+            IfMatch=head["ETag"],
+        )
+        # Each thread writes through its own handle, so the seek and write cannot interleave
+        with open(temp_path, "r+b") as f:
+            f.seek(start)
+            f.write(response["Body"].read())
 
-def download_object_s3(bucket_name: str, object_name: str, download_path: str):
+    try:
+        # Create the file at its final size so ranges can be written in any order
+        with open(temp_path, "xb") as f:
+            f.truncate(size)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            list(executor.map(download_range, range(0, size, part_size)))
+
+        os.replace(temp_path, download_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def download_object_s3(
+    bucket_name: str,
+    object_name: str,
+    download_path: str,
+    multipart_threshold: int = 16 * 1024 * 1024,
+    multipart_chunksize: int = 16 * 1024 * 1024,
+    max_concurrency: int = 16,
+    ranged: bool = False,
+    skip_unchanged: bool = False,
+):
     """
     Download an object from an S3 bucket to a local path.
 
     This function downloads a specific object from an S3 bucket and saves it to a given local path.
+    By default the boto3 transfer manager fetches objects larger than `multipart_threshold` as
+    concurrent byte ranges. When `ranged` is True, every object is fetched with explicit ranged
+    get_object requests of `multipart_chunksize` bytes, regardless of its size.
+    With `skip_unchanged`, a head_object request is made first and the download is skipped when
+    the local file already matches the object.
 
     Parameters:
     - bucket_name (str): The name of the S3 bucket.
     - object_name (str): The name of the object in the S3 bucket to be downloaded.
     - download_path (str): The local path where the file will be saved.
+    - multipart_threshold (int, optional): Object size in bytes above which the transfer manager uses ranged
+      downloads; not used when `ranged` is True. Default is 16MB.
+    - multipart_chunksize (int, optional): The size in bytes of each byte range. Default is 16MB.
+    - max_concurrency (int, optional): The number of ranges downloaded concurrently. Default is 16.
+    - ranged (bool, optional): Use explicit ranged get_object requests instead of the transfer manager.
+      Default is False.
+    - skip_unchanged (bool, optional): Skip the download if the local file already matches the S3 object.
+      Default is False.
 
     Returns:
-    - None: Prints a success message or an error message based on the result of the download.
+    - None: Logs a success message once the download is complete.
+
+    Raises:
+    - botocore.exceptions.ClientError: If the download fails after the client's retries.
+    - OSError: If the local file cannot be written.
     """
-    # Create an S3 client to interact with AWS S3
-    s3_client = boto3.client("s3")
+    # Reuse the shared S3 client to interact with AWS S3
+    s3_client = _get_client()
 
+    head = None
     try:
+        if skip_unchanged:
+            head = _head_object(bucket_name, object_name)
+            if head is not None and _matches_local(head, download_path):
+                log.info(
+                    "Skipping download of %s/%s: %s is unchanged",
+                    bucket_name,
+                    object_name,
+                    download_path,
+                )
+                return
+
         # Inform the user about the file being downloaded
-        print(f"Downloading {object_name} from bucket {bucket_name} to {download_path}...")
+        log.info(
+            "Downloading %s from bucket %s to %s...",
+            object_name,
+            bucket_name,
+            download_path,
+        )
+
+        if ranged:
+            # Reuse the skip_unchanged head when there is one instead of requesting it again
+            if head is None:
+                head = s3_client.head_object(Bucket=bucket_name, Key=object_name)
+            # Fetch the byte ranges directly for finer control over tuning
+            _download_ranged(
+                bucket_name,
+                object_name,
+                download_path,
+                head,
+                multipart_chunksize,
+                max_concurrency,
+            )
+        else:
+            # Reuse the cached transfer configuration to download large objects as concurrent
+            # byte ranges
+            config = _transfer_config(
+                multipart_threshold, multipart_chunksize, max_concurrency, _use_crt()
+            )
+            # Perform the download using boto3's download_file method with the configured transfer settings
+            s3_client.download_file(
+                bucket_name, object_name, download_path, Config=config
+            )
+    except ClientError as e:
+        log.error("S3 download failed: %s", e.response["Error"]["Code"])
+        raise
+
+    # Give the file the uploader's mtime so the next skip_unchanged check can match it
+    mtime = head.get("Metadata", {}).get("mtime") if head is not None else None
+    if mtime is not None:
+        os.utime(download_path, (int(mtime), int(mtime)))
+
+    # Log a success message when the download is complete
+    log.info("File downloaded successfully to: %s", download_path)
+
+
+def _delete_batch(bucket_name: str, batch: List[str]):
+    """
+    Delete up to 1000 objects from an S3 bucket with a single delete_objects request.
+
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - batch (list of str): The names of the objects to delete (at most 1000, the S3 limit).
+
+    Returns:
+    - List of the error entries (dicts with 'Key', 'Code' and 'Message') for objects that could not be deleted.
 
-        # Perform the download using boto3's download_file method
-        s3_client.download_file(bucket_name, object_name, download_path)
+    Raises:
+    - botocore.exceptions.ClientError: If the delete_objects request fails after the client's retries.
+    """
+    # Inform the user about the objects being deleted
+    log.info(
+        "Attempting to delete %d objects from bucket %s...", len(batch), bucket_name
+    )
 
-        # Print a success message when the download is complete
-        print(f"File downloaded successfully to: {download_path}")
+    # Perform the deletion using boto3's delete_objects method
+    try:
+        response = _get_client().delete_objects(
+            Bucket=bucket_name,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+    except ClientError as e:
+        log.error("S3 delete_objects failed: %s", e.response["Error"]["Code"])
+        raise
+
+    # In quiet mode only the keys that failed are returned
+    errors = response.get("Errors", [])
+    for error in errors:
+        log.error("Exception deleting object %s: %s", error["Key"], error["Message"])
+
+    # Log a success message for the objects that were deleted
+    log.info(
+        "%d objects deleted successfully from bucket %s.",
+        len(batch) - len(errors),
+        bucket_name,
+    )
 
-    except Exception as e:
-        print(f"Exception downloading object: {e}")
+    return errors
 
 
 def delete_object_s3(bucket_name: str, object_name: str):
     """
     Delete an object from an S3 bucket.
 
-    This function deletes a specific object from an S3 bucket by its object key.
+    This function deletes a specific object from an S3 bucket by its object key,
+    using the batched delete_objects_s3 with a single key.
 
     Parameters:
     - bucket_name (str): The name of the S3 bucket.
     - object_name (str): The name of the object in the S3 bucket to be deleted.
 
     Returns:
-    - None: Prints a success message or an error message based on the result of the deletion.
+    - None: Logs a success message once the object is deleted.
+
+    Raises:
+    - botocore.exceptions.ClientError: If the object could not be deleted.
     """
-    # Create an S3 client to interact with AWS S3
-    s3_client = boto3.client("s3")
+    errors = delete_objects_s3(bucket_name, [object_name])
+    if errors:
+        # Surface the per-key failure the same way as a failed request
+        raise ClientError({"Error": errors[0]}, "DeleteObjects")
 
-    try:
-        # Inform the user about the object being deleted
-        print(f"Attempting to delete {object_name} from bucket {bucket_name}...")
 
-        # Perform the deletion using boto3's delete_object method
-        s3_client.delete_object(Bucket=bucket_name, Key=object_name)
+def delete_objects_s3(bucket_name: str, keys: Iterable[str]):
+    """
+    Delete objects from an S3 bucket in batches.
 
-        # Print a success message upon successful deletion
-        print(f"Object {object_name} deleted successfully from bucket {bucket_name}.")
+    The keys are split into batches of 1000 (the S3 limit per delete_objects request),
+    so deleting N objects takes N / 1000 requests instead of N.
 
-    except Exception as e:
-        print(f"Exception deleting object: {e}")
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - keys (iterable of str): The names of the objects in the S3 bucket to be deleted.
+
+    Returns:
+    - List of the error entries (dicts with 'Key', 'Code' and 'Message') for objects that could not be deleted.
+
+    Raises:
+    - botocore.exceptions.ClientError: If a delete_objects request fails after the client's retries.
+    """
+    keys = list(keys)
+    errors = []
+    for i in range(0, len(keys), 1000):
+        errors.extend(_delete_batch(bucket_name, keys[i : i + 1000]))
+    return errors
+
+
+def upload_many_s3(
+    bucket_name: str,
+    pairs: Iterable[Tuple[str, str]],
+    executor: Optional[ThreadPoolExecutor] = None,
+    max_concurrency: int = 1,
+):
+    """
+    Upload many files to an S3 bucket concurrently.
+
+    Each file is uploaded with upload_object_s3 in a thread pool, so the per-request
+    round trips of many small files overlap instead of running one after another.
+
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - pairs (iterable of (str, str)): (file_path, object_name) pairs to upload.
+    - executor (ThreadPoolExecutor, optional): The thread pool to run on. Default is None, meaning the
+      module's shared 32-thread pool (see `_get_executor`).
+    - max_concurrency (int, optional): The number of parts or ranges each transfer runs in parallel.
+      Default is 1, so the request count stays at one per pool worker; keep the pool's workers times
+      this value at or below the shared client's 50 pooled connections.
+
+    Returns:
+    - None: Each upload logs its own success message.
+
+    Raises:
+    - botocore.exceptions.ClientError: If any upload fails; see upload_object_s3.
+    """
+    list(
+        (executor or _get_executor()).map(
+            lambda pair: upload_object_s3(
+                bucket_name, pair[0], pair[1], max_concurrency=max_concurrency
+            ),
+            pairs,
+        )
+    )
+
+
+def download_many_s3(
+    bucket_name: str,
+    pairs: Iterable[Tuple[str, str]],
+    executor: Optional[ThreadPoolExecutor] = None,
+    max_concurrency: int = 1,
+):
+    """
+    Download many objects from an S3 bucket concurrently.
+
+    Each object is downloaded with download_object_s3 in a thread pool.
+
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - pairs (iterable of (str, str)): (object_name, download_path) pairs to download.
+    - executor (ThreadPoolExecutor, optional): The thread pool to run on. Default is None, meaning the
+      module's shared 32-thread pool (see `_get_executor`).
+    - max_concurrency (int, optional): The number of parts or ranges each transfer runs in parallel.
+      Default is 1, so the request count stays at one per pool worker; keep the pool's workers times
+      this value at or below the shared client's 50 pooled connections.
+
+    Returns:
+    - None: Each download logs its own success message.
+
+    Raises:
+    - botocore.exceptions.ClientError: If any download fails; see download_object_s3.
+    """
+    list(
+        (executor or _get_executor()).map(
+            lambda pair: download_object_s3(
+                bucket_name, pair[0], pair[1], max_concurrency=max_concurrency
+            ),
+            pairs,
+        )
+    )
+
+
+def delete_many_s3(
+    bucket_name: str,
+    keys: Iterable[str],
+    executor: Optional[ThreadPoolExecutor] = None,
+):
+    """
+    Delete many objects from an S3 bucket.
+
+    The keys are split into batches of 1000 (the S3 limit per delete_objects request),
+    and the batches are deleted concurrently in a thread pool.
+
+    Parameters:
+    - bucket_name (str): The name of the S3 bucket.
+    - keys (iterable of str): The names of the objects in the S3 bucket to be deleted.
+    - executor (ThreadPoolExecutor, optional): The thread pool to run on. Default is None, meaning the
+      module's shared 32-thread pool (see `_get_executor`).
+
+    Returns:
+    - List of the error entries (dicts with 'Key', 'Code' and 'Message') for objects that could not be deleted.
+
+    Raises:
+    - botocore.exceptions.ClientError: If a delete_objects request fails after the client's retries.
+    """
+    keys = list(keys)
+    batches = [keys[i : i + 1000] for i in range(0, len(keys), 1000)]
+
+    results = (executor or _get_executor()).map(
+        lambda batch: _delete_batch(bucket_name, batch), batches
+    )
+    return [error for errors in results for error in errors]
 
 
 # Main function for testing the script
 if __name__ == "__main__":
+    # Show the module's progress messages when run as a script
+    logging.basicConfig(level=logging.INFO)
+
     # Replace with your actual S3 bucket name
     bucket_name = "*****"
 